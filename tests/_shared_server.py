@@ -0,0 +1,87 @@
+"""
+Bastion Backend — One SSH-backed test server shared by every suite of a test run.
+
+The xdist workers of a run coordinate through a reference-counted state file
+guarded by a file lock: the first user creates the server, the last one to
+release it deletes it.
+The server's SSH connection test is run at most once per run, the first time
+test_servers asks for it, and its outcome is kept in the same state file.
+"""
+import contextlib
+import fcntl
+import json
+import os
+import tempfile
+
+import httpx
+
+from conftest import api_post, api_delete, extract_id, SERVER_PAYLOAD, WORKER_ID
+
+# xdist workers share PYTEST_XDIST_TESTRUNUID; without xdist the run is this one process
+RUN_ID = os.getenv("PYTEST_XDIST_TESTRUNUID") or str(os.getpid())
+STATE_FILE = os.path.join(tempfile.gettempdir(), f"bastion_test_server_{RUN_ID}.json")
+# One fixed lock path for all runs: a per-run lock file would be left behind by every run
+LOCK_FILE = os.path.join(tempfile.gettempdir(), "bastion_test_server.lock")
+
+
+@contextlib.contextmanager
+def _locked_state():
+    """Yield the shared state dict while holding the lock; persist it on clean exit."""
+    with open(LOCK_FILE, "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            with open(STATE_FILE) as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            state = {"id": None, "users": 0}
+        yield state
+        if state["users"] > 0:
+            with open(STATE_FILE, "w") as f:
+                json.dump(state, f)
+        elif os.path.exists(STATE_FILE):
+            os.remove(STATE_FILE)
+
+
+def _test_ssh(server_id):
+    """Run the backend's SSH connection test; a failure is recorded, never raised."""
+    try:
+        resp = api_post(f"/servers/{server_id}/test")
+        return {"status": resp.status_code, "body": resp.json()}
+    except (httpx.HTTPError, ValueError) as exc:
+        return {"status": None, "body": str(exc)}
+
+
+def get_or_create_shared_server():
+    """Return the shared server id, creating the server if this is its first user."""
+    with _locked_state() as state:
+        if not state["id"]:
+            resp = api_post("/servers", json={
+                "name": f"Shared Test Server ({WORKER_ID})",
+                **SERVER_PAYLOAD,
+            })
+            assert resp.status_code in [200, 201], f"Setup failed: {resp.status_code} {resp.text}"
+            state["id"] = extract_id(resp, "server")
+            print(f"  Setup: Shared server created id={state['id']}")
+        state["users"] += 1
+        return state["id"]
+
+
+def shared_ssh_test(server_id):
+    """Return the shared server's SSH test as {"status", "body"}, running it on first request."""
+    with _locked_state() as state:
+        result = state.get("ssh_test")
+    if result is None:
+        # Dialled outside the lock so other workers' server_id setup never waits on it
+        result = _test_ssh(server_id)
+        with _locked_state() as state:
+            state["ssh_test"] = result
+    return result
+
+
+def teardown_shared_server():
+    """Release this process's use of the shared server, deleting it if no user remains."""
+    with _locked_state() as state:
+        state["users"] -= 1
+        if state["users"] <= 0 and state["id"]:
+            api_delete(f"/servers/{state['id']}")
+            print("  Cleanup: Shared server deleted")
@@ -1,8 +1,14 @@
 """
 Bastion Backend — Shared test configuration and fixtures.
 """
+import base64
+import json
 import os
-import requests
+import time
+
+import httpx
+import orjson
+import pytest
 
 BASE_URL = os.getenv("BASTION_URL", "http://89.47.113.196:8097/api")
 ADMIN_USERNAME = os.getenv("BASTION_USER", "ahmet")
@@ -13,10 +19,127 @@ SSH_HOST = "89.47.113.196"
 SSH_USER = "root"
 SSH_PASS = "~gM8@Ha4ZXTAJ{V0"
 
+# Connection part of a POST /servers body; callers add the name (never mutate it)
+SERVER_PAYLOAD = {
+    "host": SSH_HOST,
+    "port": 22,
+    "username": SSH_USER,
+    "password": SSH_PASS,
+    "auth_type": "password",
+}
+
+# xdist worker name ("gw0" when not distributed); suffixed onto names of resources tests create
+WORKER_ID = os.getenv("PYTEST_XDIST_WORKER", "gw0")
+
+# Client-wide headers; Authorization stays per call since some tests must go unauthenticated
+DEFAULT_HEADERS = {"User-Agent": "bastion-tests"}
+
+# Proxy-level 503/504 are retried with exponential backoff, idempotent methods only:
+# retrying POST could re-run commands or create duplicate resources. 502 is left
+# alone: the backend answers it whenever an SSH command fails, and tests accept it.
+# Connect errors are retried by the transport itself (retries=).
+RETRY_STATUSES = {503, 504}
+RETRY_METHODS = {"GET", "HEAD", "PUT", "DELETE"}
+
+
+class _RetryTransport(httpx.HTTPTransport):
+    """HTTPTransport that retries idempotent requests answered with a proxy 503/504."""
+
+    def __init__(self, total=3, backoff_factor=0.3, **kwargs):
+        super().__init__(**kwargs)
+        self.total = total
+        self.backoff_factor = backoff_factor
+
+    def handle_request(self, request):
+        response = super().handle_request(request)
+        if request.method not in RETRY_METHODS:
+            return response
+        for attempt in range(self.total):
+            if response.status_code not in RETRY_STATUSES:
+                break
+            response.close()
+            time.sleep(self.backoff_factor * 2 ** attempt)
+            response = super().handle_request(request)
+        return response
+
+
+_stdlib_response_json = httpx.Response.json
+
+
+def _orjson_response_json(self, **kwargs):
+    """Response.json() decoded with orjson; stdlib json only when decode kwargs are passed."""
+    if kwargs:
+        return _stdlib_response_json(self, **kwargs)
+    return orjson.loads(self.content)
+
+
+# Every resp.json() in the suite, sync or async client, goes through orjson
+httpx.Response.json = _orjson_response_json
+
+
+# One pooled client for the whole process. HTTP/2 is negotiated via ALPN on https
+# URLs, so concurrent calls multiplex over one connection; plain http falls back
+# to HTTP/1.1 keep-alive.
+CLIENT = httpx.Client(
+    base_url=BASE_URL,
+    headers=DEFAULT_HEADERS,
+    timeout=httpx.Timeout(15.0, connect=10.0),
+    transport=_RetryTransport(
+        http2=True,
+        retries=2,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+    ),
+)
+
+
+def pytest_configure(config):
+    """Open the first pooled connection before any test so none pays for the handshake.
+
+    Runs in every xdist worker (each has its own pool); the controller process
+    sends no API traffic and is skipped.
+    """
+    if not hasattr(config, "workerinput") and config.getoption("numprocesses", None):
+        return
+    try:
+        CLIENT.head("/health", timeout=5)
+    except httpx.HTTPError:
+        pass
+
+
+@pytest.fixture(scope="session", autouse=True)
+def http_client():
+    """Log in once per worker up front and close pooled connections at the end."""
+    auth_headers()
+    yield CLIENT
+    CLIENT.close()
+
+
+@pytest.fixture(scope="session")
+def server_id():
+    """SSH-backed test server shared by every suite of the run (see _shared_server)."""
+    from _shared_server import get_or_create_shared_server, teardown_shared_server
+
+    sid = get_or_create_shared_server()
+    yield sid
+    teardown_shared_server()
+
+
+@pytest.fixture(scope="session")
+async def client():
+    """Session-wide AsyncClient for tests that fan out independent calls with asyncio.gather."""
+    async with httpx.AsyncClient(
+        base_url=BASE_URL,
+        headers=DEFAULT_HEADERS,
+        http2=True,
+        timeout=httpx.Timeout(30.0, connect=10.0),
+        limits=httpx.Limits(max_keepalive_connections=20),
+    ) as async_client:
+        yield async_client
+
 
 def get_tokens():
     """Login and return (access_token, refresh_token)."""
-    resp = requests.post(f"{BASE_URL}/auth/login", json={
+    resp = CLIENT.post("/auth/login", json={
         "username": ADMIN_USERNAME,
         "password": ADMIN_PASSWORD,
     }, timeout=10)
@@ -25,23 +148,93 @@ def get_tokens():
     return data["access_token"], data["refresh_token"]
 
 
+# Access token cached for the whole process; refreshed shortly before expiry or on 401.
+# The header dict is built once per token and handed out as-is.
+_TOKEN_CACHE = {"access": None, "refresh": None, "exp": 0, "headers": None}
+
+
+def _jwt_exp(token):
+    """Return the `exp` claim of a JWT without verifying its signature."""
+    payload = token.split(".")[1]
+    payload += "=" * (-len(payload) % 4)
+    return json.loads(base64.urlsafe_b64decode(payload)).get("exp", 0)
+
+
+def _get_access_token():
+    """Return a usable access token, logging in only when the cached one is stale."""
+    access = _TOKEN_CACHE["access"]
+    if access and time.time() < _TOKEN_CACHE["exp"] - 30:
+        return access
+    access, refresh = get_tokens()
+    _TOKEN_CACHE.update(
+        access=access,
+        refresh=refresh,
+        exp=_jwt_exp(access),
+        headers={"Authorization": f"Bearer {access}"},
+    )
+    return access
+
+
 def auth_headers():
-    """Return Authorization header dict."""
-    token, _ = get_tokens()
-    return {"Authorization": f"Bearer {token}"}
+    """Return the Authorization header dict for the cached token (treat it as read-only)."""
+    _get_access_token()
+    return _TOKEN_CACHE["headers"]
+
+
+def _request(method, path, **kwargs):
+    """Send an authenticated request; expiry is handled up front by _get_access_token.
+
+    A 401 is returned as-is: endpoints such as PUT /auth/password answer it for
+    bad input, so it does not mean the token was rejected.
+    """
+    return CLIENT.request(method, path, headers=auth_headers(), **kwargs)
 
 
 def api_get(path, params=None):
-    return requests.get(f"{BASE_URL}{path}", headers=auth_headers(), params=params, timeout=15)
+    return _request("GET", path, params=params, timeout=15)
 
 
 def api_post(path, json=None):
-    return requests.post(f"{BASE_URL}{path}", headers=auth_headers(), json=json, timeout=30)
+    return _request("POST", path, json=json, timeout=30)
 
 
 def api_put(path, json=None):
-    return requests.put(f"{BASE_URL}{path}", headers=auth_headers(), json=json, timeout=15)
+    return _request("PUT", path, json=json, timeout=15)
 
 
 def api_delete(path):
-    return requests.delete(f"{BASE_URL}{path}", headers=auth_headers(), timeout=15)
+    return _request("DELETE", path, timeout=15)
+
+
+def api_get_json(path, params=None):
+    """GET a JSON endpoint, fail on HTTP errors and return (body, response)."""
+    resp = api_get(path, params=params)
+    resp.raise_for_status()
+    return resp.json(), resp
+
+
+def extract_id(resp, key):
+    """Return the id of a created object, whether wrapped under `key` or returned bare."""
+    data = resp.json()
+    obj = data.get(key, data)
+    return obj.get("id") or obj.get("ID")
+
+
+# Ids removed by a delete test, so a fixture's teardown can skip its own DELETE
+_DELETED_IDS = set()
+
+
+def mark_deleted(resource_id):
+    _DELETED_IDS.add(resource_id)
+
+
+def was_deleted(resource_id):
+    return resource_id in _DELETED_IDS
+
+
+async def api_get_async(client, path, params=None):
+    return await client.get(path, headers=auth_headers(), params=params)
+
+
+async def api_post_async(client, path, json=None):
+    return await client.post(path, headers=auth_headers(), json=json)
@@ -1,7 +1,11 @@
 """
 Test: AI assistant endpoints (chat, execute, analyze).
 """
-from conftest import api_get, api_post, api_delete
+import asyncio
+
+import pytest
+
+from conftest import api_get, api_get_json, api_post, api_post_async
 
 
 def test_chat_nonstream():
@@ -19,66 +23,66 @@ def test_chat_nonstream():
         print(f"  PASS: AI chat returned {resp.status_code} (LLM may not be configured)")
 
 
-def test_conversations_list():
+@pytest.fixture(scope="module")
+def conversations():
+    """Fetch the conversation list once for the tests that need it."""
+    data, _ = api_get_json("/ai/conversations")
+    return data.get("conversations", data)
+
+
+def test_conversations_list(conversations):
     """GET /api/ai/conversations — list conversations."""
-    resp = api_get("/ai/conversations")
-    assert resp.status_code == 200, f"List conversations failed: {resp.status_code} {resp.text}"
-    data = resp.json()
-    convos = data.get("conversations", data)
-    assert isinstance(convos, list)
-    print(f"  PASS: Listed {len(convos)} AI conversations")
-    return convos
+    assert isinstance(conversations, list)
+    print(f"  PASS: Listed {len(conversations)} AI conversations")
 
 
-def test_conversation_detail():
+def test_conversation_detail(conversations):
     """GET /api/ai/conversations/:id — get single conversation."""
-    convos = test_conversations_list()
-    if not convos:
-        print("  SKIP: No conversations")
-        return
-    cid = convos[0].get("id") or convos[0].get("ID")
+    if not conversations:
+        pytest.skip("No conversations")
+    cid = conversations[0].get("id") or conversations[0].get("ID")
     if not cid:
-        print("  SKIP: No conversation ID")
-        return
+        pytest.skip("No conversation ID")
     resp = api_get(f"/ai/conversations/{cid}")
     assert resp.status_code == 200, f"Get convo failed: {resp.status_code}"
     print("  PASS: Conversation detail retrieved")
 
 
-def test_analyze_logs():
+@pytest.fixture(scope="module")
+async def ai_actions(client):
+    """Fire the independent analyze / suggest / execute calls concurrently."""
+    analyze, suggest, execute = await asyncio.gather(
+        api_post_async(client, "/ai/analyze-logs", json={
+            "logs": "2026-02-17 ERROR: connection refused to database\n2026-02-17 PANIC: runtime error",
+            "context": "bastion backend",
+        }),
+        api_post_async(client, "/ai/suggest-fix", json={
+            "error": "FATAL: password authentication failed for user postgres",
+            "context": "PostgreSQL connection",
+        }),
+        api_post_async(client, "/ai/execute", json={
+            "action": "get_metrics",
+        }),
+    )
+    return {"analyze": analyze, "suggest": suggest, "execute": execute}
+
+
+def test_analyze_logs(ai_actions):
     """POST /api/ai/analyze-logs — log analysis."""
-    resp = api_post("/ai/analyze-logs", json={
-        "logs": "2026-02-17 ERROR: connection refused to database\n2026-02-17 PANIC: runtime error",
-        "context": "bastion backend",
-    })
+    resp = ai_actions["analyze"]
     assert resp.status_code in [200, 400, 502, 503], f"Analyze failed: {resp.status_code}"
     print(f"  PASS: Log analysis returned {resp.status_code}")
 
 
-def test_suggest_fix():
+def test_suggest_fix(ai_actions):
     """POST /api/ai/suggest-fix — error fix suggestion."""
-    resp = api_post("/ai/suggest-fix", json={
-        "error": "FATAL: password authentication failed for user postgres",
-        "context": "PostgreSQL connection",
-    })
+    resp = ai_actions["suggest"]
     assert resp.status_code in [200, 400, 502, 503], f"Suggest failed: {resp.status_code}"
     print(f"  PASS: Suggest fix returned {resp.status_code}")
 
 
-def test_execute_action():
+def test_execute_action(ai_actions):
     """POST /api/ai/execute — execute AI action."""
-    resp = api_post("/ai/execute", json={
-        "action": "get_metrics",
-    })
+    resp = ai_actions["execute"]
     assert resp.status_code in [200, 400, 404, 502], f"Execute failed: {resp.status_code}"
     print(f"  PASS: AI execute returned {resp.status_code}")
-
-
-if __name__ == "__main__":
-    test_chat_nonstream()
-    test_conversations_list()
-    test_conversation_detail()
-    test_analyze_logs()
-    test_suggest_fix()
-    test_execute_action()
-    print("\nALL AI TESTS PASSED")
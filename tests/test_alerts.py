@@ -1,14 +1,14 @@
 """
 Test: Alert rules and alerts endpoints.
 """
-from conftest import api_get, api_post, api_put, api_delete
+import pytest
 
-RULE_ID = None
+from conftest import api_get, api_get_json, api_post, api_put, api_delete, extract_id, mark_deleted, was_deleted
 
 
-def test_create_alert_rule():
-    """POST /api/alerts/rules — create alert rule."""
-    global RULE_ID
+@pytest.fixture(scope="module")
+def rule_id():
+    """Create an alert rule for this module and remove it afterwards."""
     resp = api_post("/alerts/rules", json={
         "name": "Test CPU Alert",
         "type": "metric",
@@ -19,17 +19,21 @@ def test_create_alert_rule():
         "notification_channel": "telegram",
     })
     assert resp.status_code in [200, 201], f"Create rule failed: {resp.status_code} {resp.text}"
-    data = resp.json()
-    rule = data.get("rule", data)
-    RULE_ID = rule.get("id") or rule.get("ID")
-    print(f"  PASS: Alert rule created — id={RULE_ID}")
+    rid = extract_id(resp, "rule")
+    yield rid
+    if rid and not was_deleted(rid):
+        api_delete(f"/alerts/rules/{rid}")
+
+
+def test_create_alert_rule(rule_id):
+    """POST /api/alerts/rules — create alert rule."""
+    assert rule_id, "Missing rule ID"
+    print(f"  PASS: Alert rule created — id={rule_id}")
 
 
 def test_list_alert_rules():
     """GET /api/alerts/rules — list all rules."""
-    resp = api_get("/alerts/rules")
-    assert resp.status_code == 200, f"List rules failed: {resp.status_code} {resp.text}"
-    data = resp.json()
+    data, _ = api_get_json("/alerts/rules")
     rules = data.get("rules", data)
     assert isinstance(rules, list)
     print(f"  PASS: Listed {len(rules)} alert rules")
@@ -52,20 +56,10 @@ def test_list_alerts_filtered():
     print("  PASS: Filtered alerts retrieved")
 
 
-def test_delete_alert_rule():
+def test_delete_alert_rule(rule_id):
     """DELETE /api/alerts/rules/:id — delete rule."""
-    if not RULE_ID:
-        print("  SKIP: No rule")
-        return
-    resp = api_delete(f"/alerts/rules/{RULE_ID}")
+    resp = api_delete(f"/alerts/rules/{rule_id}")
     assert resp.status_code == 200, f"Delete rule failed: {resp.status_code} {resp.text}"
+    mark_deleted(rule_id)
     print("  PASS: Alert rule deleted")
 
-
-if __name__ == "__main__":
-    test_create_alert_rule()
-    test_list_alert_rules()
-    test_list_alerts()
-    test_list_alerts_filtered()
-    test_delete_alert_rule()
-    print("\nALL ALERT TESTS PASSED")
@@ -1,12 +1,27 @@
 """
 Test: Audit log endpoints.
 """
-from conftest import api_get
+import asyncio
 
+import pytest
 
-def test_list_audit_logs():
+from conftest import api_get_async
+
+
+@pytest.fixture(scope="module")
+async def audit(client):
+    """Query the plain, paginated and filtered audit views concurrently."""
+    listing, paginated, filtered = await asyncio.gather(
+        api_get_async(client, "/audit"),
+        api_get_async(client, "/audit", params={"page": 1, "per_page": 5}),
+        api_get_async(client, "/audit", params={"action": "login"}),
+    )
+    return {"list": listing, "paginated": paginated, "filtered": filtered}
+
+
+def test_list_audit_logs(audit):
     """GET /api/audit — list audit logs."""
-    resp = api_get("/audit")
+    resp = audit["list"]
     assert resp.status_code == 200, f"Audit failed: {resp.status_code} {resp.text}"
     data = resp.json()
     logs = data.get("logs", data)
@@ -14,24 +29,17 @@ def test_list_audit_logs():
     print(f"  PASS: Listed {len(logs)} audit log entries")
 
 
-def test_audit_pagination():
+def test_audit_pagination(audit):
     """GET /api/audit?page=1&per_page=5 — paginated."""
-    resp = api_get("/audit", params={"page": 1, "per_page": 5})
+    resp = audit["paginated"]
     assert resp.status_code == 200, f"Paginated audit failed: {resp.status_code}"
     data = resp.json()
     assert "total" in data or "logs" in data, f"Missing fields: {data}"
     print("  PASS: Paginated audit retrieved")
 
 
-def test_audit_filter_action():
+def test_audit_filter_action(audit):
     """GET /api/audit?action=login — filter by action."""
-    resp = api_get("/audit", params={"action": "login"})
+    resp = audit["filtered"]
     assert resp.status_code == 200, f"Filtered audit failed: {resp.status_code}"
     print("  PASS: Filtered audit by action")
-
-
-if __name__ == "__main__":
-    test_list_audit_logs()
-    test_audit_pagination()
-    test_audit_filter_action()
-    print("\nALL AUDIT TESTS PASSED")
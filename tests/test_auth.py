@@ -1,18 +1,27 @@
 """
 Test: Authentication endpoints — login, refresh, me, password change.
 """
-import requests
-from conftest import BASE_URL, ADMIN_USERNAME, ADMIN_PASSWORD, get_tokens, auth_headers, api_get, api_put
+from concurrent.futures import ThreadPoolExecutor
 
+import pytest
 
-def test_login_success():
-    """POST /api/auth/login — valid credentials."""
-    resp = requests.post(f"{BASE_URL}/auth/login", json={
+from conftest import CLIENT, ADMIN_USERNAME, ADMIN_PASSWORD, auth_headers, api_get, api_put
+
+
+@pytest.fixture(scope="module")
+def login():
+    """Log in once; the tokens are reused by the refresh test."""
+    resp = CLIENT.post("/auth/login", json={
         "username": ADMIN_USERNAME,
         "password": ADMIN_PASSWORD,
     }, timeout=10)
     assert resp.status_code == 200, f"Login failed: {resp.status_code} {resp.text}"
-    data = resp.json()
+    return resp.json()
+
+
+def test_login_success(login):
+    """POST /api/auth/login — valid credentials."""
+    data = login
     assert "access_token" in data, "Missing access_token"
     assert "refresh_token" in data, "Missing refresh_token"
     assert data["user"]["username"] == ADMIN_USERNAME
@@ -22,12 +31,26 @@ def test_login_success():
     print(f"  PASS: Login success — user={data['user']['username']}, role={data['user']['role']}")
 
 
-def test_login_wrong_password():
+@pytest.fixture(scope="module")
+def rejected_logins():
+    """Send the bad-credential logins concurrently so their server-side hashing overlaps."""
+    attempts = {
+        "wrong_password": {"json": {"username": ADMIN_USERNAME, "password": "wrong_password_123"}},
+        "wrong_username": {"json": {"username": "nonexistent_user", "password": ADMIN_PASSWORD}},
+        "empty_body": {"json": {}},
+        "no_content_type": {"content": "not json"},
+    }
+    with ThreadPoolExecutor(max_workers=len(attempts)) as pool:
+        futures = {
+            name: pool.submit(CLIENT.post, "/auth/login", timeout=10, **kwargs)
+            for name, kwargs in attempts.items()
+        }
+        return {name: future.result() for name, future in futures.items()}
+
+
+def test_login_wrong_password(rejected_logins):
     """POST /api/auth/login — wrong password should return 401."""
-    resp = requests.post(f"{BASE_URL}/auth/login", json={
-        "username": ADMIN_USERNAME,
-        "password": "wrong_password_123",
-    }, timeout=10)
+    resp = rejected_logins["wrong_password"]
     assert resp.status_code == 401, f"Expected 401, got {resp.status_code}"
     data = resp.json()
     assert data["error"] is True
@@ -35,12 +58,9 @@ def test_login_wrong_password():
     print("  PASS: Wrong password correctly returns 401")
 
 
-def test_login_wrong_username():
+def test_login_wrong_username(rejected_logins):
     """POST /api/auth/login — wrong username should return 401."""
-    resp = requests.post(f"{BASE_URL}/auth/login", json={
-        "username": "nonexistent_user",
-        "password": ADMIN_PASSWORD,
-    }, timeout=10)
+    resp = rejected_logins["wrong_username"]
     assert resp.status_code == 401, f"Expected 401, got {resp.status_code}"
     data = resp.json()
     assert data["error"] is True
@@ -48,25 +68,24 @@ def test_login_wrong_username():
     print("  PASS: Wrong username correctly returns 401")
 
 
-def test_login_empty_body():
+def test_login_empty_body(rejected_logins):
     """POST /api/auth/login — empty body should return 400 or 401."""
-    resp = requests.post(f"{BASE_URL}/auth/login", json={}, timeout=10)
+    resp = rejected_logins["empty_body"]
     assert resp.status_code in [400, 401], f"Expected 400/401, got {resp.status_code}"
     print(f"  PASS: Empty body returns {resp.status_code}")
 
 
-def test_login_no_content_type():
+def test_login_no_content_type(rejected_logins):
     """POST /api/auth/login — no JSON content type."""
-    resp = requests.post(f"{BASE_URL}/auth/login", data="not json", timeout=10)
+    resp = rejected_logins["no_content_type"]
     assert resp.status_code in [400, 401, 415, 422], f"Expected error, got {resp.status_code}"
     print(f"  PASS: No content type returns {resp.status_code}")
 
 
-def test_refresh_token():
+def test_refresh_token(login):
     """POST /api/auth/refresh — refresh access token."""
-    _, refresh = get_tokens()
-    resp = requests.post(f"{BASE_URL}/auth/refresh", json={
-        "refresh_token": refresh,
+    resp = CLIENT.post("/auth/refresh", json={
+        "refresh_token": login["refresh_token"],
     }, timeout=10)
     assert resp.status_code == 200, f"Refresh failed: {resp.status_code} {resp.text}"
     data = resp.json()
@@ -77,7 +96,7 @@ def test_refresh_token():
 
 def test_refresh_invalid_token():
     """POST /api/auth/refresh — invalid token should fail."""
-    resp = requests.post(f"{BASE_URL}/auth/refresh", json={
+    resp = CLIENT.post("/auth/refresh", json={
         "refresh_token": "invalid.token.here",
     }, timeout=10)
     assert resp.status_code in [400, 401], f"Expected error, got {resp.status_code}"
@@ -96,7 +115,7 @@ def test_me_endpoint():
 
 def test_me_no_auth():
     """GET /api/auth/me — without token should return 401."""
-    resp = requests.get(f"{BASE_URL}/auth/me", timeout=10)
+    resp = CLIENT.get("/auth/me", timeout=10)
     assert resp.status_code == 401, f"Expected 401, got {resp.status_code}"
     print("  PASS: /auth/me without auth returns 401")
 
@@ -120,17 +139,3 @@ def test_password_change_too_short():
     assert resp.status_code == 400, f"Expected 400, got {resp.status_code}"
     print("  PASS: Short new password returns 400")
 
-
-if __name__ == "__main__":
-    test_login_success()
-    test_login_wrong_password()
-    test_login_wrong_username()
-    test_login_empty_body()
-    test_login_no_content_type()
-    test_refresh_token()
-    test_refresh_invalid_token()
-    test_me_endpoint()
-    test_me_no_auth()
-    test_password_change_wrong_old()
-    test_password_change_too_short()
-    print("\nALL AUTH TESTS PASSED")
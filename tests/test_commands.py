@@ -1,35 +1,12 @@
 """
 Test: Command execution and history endpoints.
 """
-from conftest import api_get, api_post, api_delete, SSH_HOST, SSH_USER, SSH_PASS
+from conftest import api_get, api_post
 
-SERVER_ID = None
 
-
-def setup_server():
-    """Create a temporary server for command tests."""
-    global SERVER_ID
-    resp = api_post("/servers", json={
-        "name": "CMD Test Server",
-        "host": SSH_HOST,
-        "port": 22,
-        "username": SSH_USER,
-        "password": SSH_PASS,
-        "auth_type": "password",
-    })
-    assert resp.status_code in [200, 201], f"Setup failed: {resp.status_code} {resp.text}"
-    data = resp.json()
-    server = data.get("server", data)
-    SERVER_ID = server.get("id") or server.get("ID")
-    print(f"  Setup: Server created id={SERVER_ID}")
-
-
-def test_exec_command():
+def test_exec_command(server_id):
     """POST /api/servers/:id/exec — execute a command via SSH."""
-    if not SERVER_ID:
-        print("  SKIP: No server")
-        return
-    resp = api_post(f"/servers/{SERVER_ID}/exec", json={
+    resp = api_post(f"/servers/{server_id}/exec", json={
         "command": "echo 'hello from bastion test'",
     })
     assert resp.status_code == 200, f"Exec failed: {resp.status_code} {resp.text}"
@@ -40,12 +17,9 @@ def test_exec_command():
     print(f"  PASS: Command exec — output='{data['output'].strip()}'")
 
 
-def test_exec_command_with_error():
+def test_exec_command_with_error(server_id):
     """POST /api/servers/:id/exec — command that fails."""
-    if not SERVER_ID:
-        print("  SKIP: No server")
-        return
-    resp = api_post(f"/servers/{SERVER_ID}/exec", json={
+    resp = api_post(f"/servers/{server_id}/exec", json={
         "command": "ls /nonexistent_path_12345",
     })
     assert resp.status_code == 200, f"Exec failed: {resp.status_code} {resp.text}"
@@ -55,12 +29,9 @@ def test_exec_command_with_error():
     print(f"  PASS: Failed command returns exit_code={data.get('exit_code')}")
 
 
-def test_command_history():
+def test_command_history(server_id):
     """GET /api/servers/:id/history — command history."""
-    if not SERVER_ID:
-        print("  SKIP: No server")
-        return
-    resp = api_get(f"/servers/{SERVER_ID}/history")
+    resp = api_get(f"/servers/{server_id}/history")
     assert resp.status_code == 200, f"History failed: {resp.status_code} {resp.text}"
     data = resp.json()
     history = data.get("history", [])
@@ -75,19 +46,3 @@ def test_favorites():
     assert resp.status_code == 200, f"Favorites failed: {resp.status_code} {resp.text}"
     print("  PASS: Favorites list retrieved")
 
-
-def cleanup_server():
-    """Delete the temporary server."""
-    if SERVER_ID:
-        api_delete(f"/servers/{SERVER_ID}")
-        print("  Cleanup: Server deleted")
-
-
-if __name__ == "__main__":
-    setup_server()
-    test_exec_command()
-    test_exec_command_with_error()
-    test_command_history()
-    test_favorites()
-    cleanup_server()
-    print("\nALL COMMAND TESTS PASSED")
@@ -1,12 +1,33 @@
 """
 Test: Coolify proxy endpoints.
 """
-from conftest import api_get, api_post
+import asyncio
 
+import pytest
 
-def test_list_apps():
+from conftest import api_get_async
+
+BASTION_APP = "dosgc4go4skko4kc0s4oksg8"
+
+
+@pytest.fixture(scope="module")
+async def coolify(client):
+    """Fetch every read-only Coolify endpoint concurrently, keyed by path."""
+    paths = [
+        "/coolify/apps",
+        f"/coolify/apps/{BASTION_APP}",
+        f"/coolify/apps/{BASTION_APP}/envs",
+        "/coolify/databases",
+        "/coolify/services",
+        "/coolify/deployments",
+    ]
+    responses = await asyncio.gather(*(api_get_async(client, path) for path in paths))
+    return dict(zip(paths, responses))
+
+
+def test_list_apps(coolify):
     """GET /api/coolify/apps — list Coolify applications."""
-    resp = api_get("/coolify/apps")
+    resp = coolify["/coolify/apps"]
     assert resp.status_code == 200, f"List apps failed: {resp.status_code} {resp.text}"
     data = resp.json()
     assert isinstance(data, (list, dict)), f"Unexpected type: {type(data)}"
@@ -14,46 +35,36 @@ def test_list_apps():
     print(f"  PASS: Coolify apps listed — {count} entries")
 
 
-def test_get_app():
+def test_get_app(coolify):
     """GET /api/coolify/apps/:uuid — get single app (Bastion itself)."""
-    resp = api_get("/coolify/apps/dosgc4go4skko4kc0s4oksg8")
+    resp = coolify[f"/coolify/apps/{BASTION_APP}"]
     assert resp.status_code == 200, f"Get app failed: {resp.status_code} {resp.text}"
     print("  PASS: Got Bastion app details from Coolify")
 
 
-def test_get_app_envs():
+def test_get_app_envs(coolify):
     """GET /api/coolify/apps/:uuid/envs — get app env vars."""
-    resp = api_get("/coolify/apps/dosgc4go4skko4kc0s4oksg8/envs")
+    resp = coolify[f"/coolify/apps/{BASTION_APP}/envs"]
     assert resp.status_code == 200, f"Get envs failed: {resp.status_code} {resp.text}"
     print("  PASS: Got app environment variables")
 
 
-def test_list_databases():
+def test_list_databases(coolify):
     """GET /api/coolify/databases — list databases."""
-    resp = api_get("/coolify/databases")
+    resp = coolify["/coolify/databases"]
     assert resp.status_code == 200, f"List DBs failed: {resp.status_code} {resp.text}"
     print("  PASS: Coolify databases listed")
 
 
-def test_list_services():
+def test_list_services(coolify):
     """GET /api/coolify/services — list services."""
-    resp = api_get("/coolify/services")
+    resp = coolify["/coolify/services"]
     assert resp.status_code == 200, f"List services failed: {resp.status_code} {resp.text}"
     print("  PASS: Coolify services listed")
 
 
-def test_list_deployments():
+def test_list_deployments(coolify):
     """GET /api/coolify/deployments — list deployments."""
-    resp = api_get("/coolify/deployments")
+    resp = coolify["/coolify/deployments"]
     assert resp.status_code == 200, f"List deployments failed: {resp.status_code} {resp.text}"
     print("  PASS: Coolify deployments listed")
-
-
-if __name__ == "__main__":
-    test_list_apps()
-    test_get_app()
-    test_get_app_envs()
-    test_list_databases()
-    test_list_services()
-    test_list_deployments()
-    print("\nALL COOLIFY TESTS PASSED")
@@ -2,8 +2,7 @@
 Test: Dashboard and System endpoints.
 """
 from conftest import api_get
-import requests
-from conftest import BASE_URL
+from conftest import CLIENT
 
 
 def test_dashboard_overview():
@@ -18,7 +17,7 @@ def test_dashboard_overview():
 
 def test_dashboard_no_auth():
     """GET /api/dashboard/overview — without auth should 401."""
-    resp = requests.get(f"{BASE_URL}/dashboard/overview", timeout=10)
+    resp = CLIENT.get("/dashboard/overview", timeout=10)
     assert resp.status_code == 401, f"Expected 401, got {resp.status_code}"
     print("  PASS: Dashboard without auth returns 401")
 
@@ -40,10 +39,3 @@ def test_status_page():
     assert "status" in data, "Missing status field"
     print(f"  PASS: Status page — status={data.get('status')}")
 
-
-if __name__ == "__main__":
-    test_dashboard_overview()
-    test_dashboard_no_auth()
-    test_system_info()
-    test_status_page()
-    print("\nALL DASHBOARD TESTS PASSED")
@@ -1,27 +1,31 @@
 """
 Test: Database management endpoints.
 """
+import pytest
+
 from conftest import api_get, api_post
 
 
-def test_list_tables():
-    """GET /api/database/tables — list all tables."""
+@pytest.fixture(scope="module")
+def tables():
+    """Fetch the table list once for the tests that need it."""
     resp = api_get("/database/tables")
     assert resp.status_code == 200, f"List tables failed: {resp.status_code} {resp.text}"
     data = resp.json()
-    tables = data.get("tables", data)
+    return data.get("tables", data)
+
+
+def test_list_tables(tables):
+    """GET /api/database/tables — list all tables."""
     assert isinstance(tables, list)
     assert len(tables) > 0, "Expected at least 1 table"
     print(f"  PASS: Listed {len(tables)} tables")
-    return tables
 
 
-def test_get_table_rows():
+def test_get_table_rows(tables):
     """GET /api/database/tables/:name/rows — get rows from table."""
-    tables = test_list_tables()
     if not tables:
-        print("  SKIP: No tables")
-        return
+        pytest.skip("No tables")
     table_name = tables[0].get("name", tables[0]) if isinstance(tables[0], dict) else tables[0]
     resp = api_get(f"/database/tables/{table_name}/rows", params={"limit": 5})
     assert resp.status_code == 200, f"Get rows failed: {resp.status_code} {resp.text}"
@@ -67,12 +71,3 @@ def test_database_stats():
     assert "database_size" in data or "version" in data, f"Unexpected response: {data}"
     print(f"  PASS: DB stats — size={data.get('database_size', 'N/A')}")
 
-
-if __name__ == "__main__":
-    test_list_tables()
-    test_get_table_rows()
-    test_read_only_query()
-    test_mutation_blocked()
-    test_drop_blocked()
-    test_database_stats()
-    print("\nALL DATABASE TESTS PASSED")
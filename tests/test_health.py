@@ -1,13 +1,20 @@
 """
 Test: Health endpoint (public, no auth required).
 """
-import requests
-from conftest import BASE_URL
+import httpx
+
+from conftest import BASE_URL, DEFAULT_HEADERS
+
+# Health is cheap: a slow answer is a failure, not something to wait 10s for.
+# Sent outside the shared CLIENT so neither of its retry layers stretches that
+# bound (/health answers 503 when the DB is down).
+HEALTH_URL = f"{BASE_URL}/health"
+HEALTH_TIMEOUT = httpx.Timeout(3.0, connect=2.0)
 
 
 def test_health():
     """GET /api/health — should return status ok with DB check."""
-    resp = requests.get(f"{BASE_URL}/health", timeout=10)
+    resp = httpx.get(HEALTH_URL, headers=DEFAULT_HEADERS, timeout=HEALTH_TIMEOUT)
     assert resp.status_code == 200, f"Expected 200, got {resp.status_code}: {resp.text}"
     data = resp.json()
     assert data["status"] == "ok", f"Health status not ok: {data}"
@@ -18,7 +25,3 @@ def test_health():
     assert "time" in data, "Missing time field"
     print(f"  PASS: Health OK — version={data['version']}, uptime={data['uptime']}")
 
-
-if __name__ == "__main__":
-    test_health()
-    print("ALL HEALTH TESTS PASSED")
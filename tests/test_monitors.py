@@ -1,16 +1,19 @@
 """
 Test: Monitor (uptime + SSL) endpoints.
 """
-from conftest import api_get, api_post, api_delete
+import asyncio
+import uuid
 
-MONITOR_ID = None
+import pytest
 
+from conftest import api_get, api_get_async, api_post, api_delete, extract_id, mark_deleted, was_deleted
 
-def test_create_monitor():
-    """POST /api/monitors — create uptime monitor."""
-    global MONITOR_ID
+
+@pytest.fixture(scope="module")
+def monitor_id():
+    """Create an uptime monitor for this module and remove it afterwards."""
     resp = api_post("/monitors", json={
-        "name": "Test Monitor — Bastion Health",
+        "name": f"Test Monitor — Bastion Health {uuid.uuid4().hex[:8]}",
         "url": "http://89.47.113.196:8097/api/health",
         "type": "http",
         "method": "GET",
@@ -19,10 +22,27 @@ def test_create_monitor():
         "expected_status": 200,
     })
     assert resp.status_code in [200, 201], f"Create monitor failed: {resp.status_code} {resp.text}"
-    data = resp.json()
-    monitor = data.get("monitor", data)
-    MONITOR_ID = monitor.get("id") or monitor.get("ID")
-    print(f"  PASS: Monitor created — id={MONITOR_ID}")
+    mid = extract_id(resp, "monitor")
+    yield mid
+    if mid and not was_deleted(mid):
+        api_delete(f"/monitors/{mid}")
+
+
+def test_create_monitor(monitor_id):
+    """POST /api/monitors — create uptime monitor."""
+    assert monitor_id, "Missing monitor ID"
+    print(f"  PASS: Monitor created — id={monitor_id}")
+
+
+@pytest.fixture(scope="module")
+async def monitor_reads(client, monitor_id):
+    """Fetch the monitor, its pings and the SSL list concurrently — none depends on another."""
+    detail, pings, ssl = await asyncio.gather(
+        api_get_async(client, f"/monitors/{monitor_id}"),
+        api_get_async(client, f"/monitors/{monitor_id}/pings"),
+        api_get_async(client, "/monitors/ssl"),
+    )
+    return {"detail": detail, "pings": pings, "ssl": ssl}
 
 
 def test_list_monitors():
@@ -35,39 +55,30 @@ def test_list_monitors():
     print(f"  PASS: Listed {len(monitors)} monitors")
 
 
-def test_get_monitor():
+def test_get_monitor(monitor_reads):
     """GET /api/monitors/:id — get single monitor with pings."""
-    if not MONITOR_ID:
-        print("  SKIP: No monitor")
-        return
-    resp = api_get(f"/monitors/{MONITOR_ID}")
+    resp = monitor_reads["detail"]
     assert resp.status_code == 200, f"Get monitor failed: {resp.status_code} {resp.text}"
     print("  PASS: Monitor details retrieved")
 
 
-def test_toggle_monitor():
+def test_toggle_monitor(monitor_id):
     """POST /api/monitors/:id/toggle — enable/disable."""
-    if not MONITOR_ID:
-        print("  SKIP: No monitor")
-        return
-    resp = api_post(f"/monitors/{MONITOR_ID}/toggle")
+    resp = api_post(f"/monitors/{monitor_id}/toggle")
     assert resp.status_code == 200, f"Toggle failed: {resp.status_code} {resp.text}"
     print("  PASS: Monitor toggled")
 
 
-def test_monitor_pings():
+def test_monitor_pings(monitor_reads):
     """GET /api/monitors/:id/pings — get ping history."""
-    if not MONITOR_ID:
-        print("  SKIP: No monitor")
-        return
-    resp = api_get(f"/monitors/{MONITOR_ID}/pings")
+    resp = monitor_reads["pings"]
     assert resp.status_code == 200, f"Pings failed: {resp.status_code} {resp.text}"
     print("  PASS: Monitor pings retrieved")
 
 
-def test_ssl_list():
+def test_ssl_list(monitor_reads):
     """GET /api/monitors/ssl — list SSL certificates."""
-    resp = api_get("/monitors/ssl")
+    resp = monitor_reads["ssl"]
     assert resp.status_code == 200, f"SSL list failed: {resp.status_code} {resp.text}"
     print("  PASS: SSL cert list retrieved")
 
@@ -83,23 +94,10 @@ def test_ssl_check():
     print(f"  PASS: SSL check — github.com days_remaining={data['days_remaining']}")
 
 
-def test_delete_monitor():
+def test_delete_monitor(monitor_id):
     """DELETE /api/monitors/:id — delete monitor."""
-    if not MONITOR_ID:
-        print("  SKIP: No monitor")
-        return
-    resp = api_delete(f"/monitors/{MONITOR_ID}")
+    resp = api_delete(f"/monitors/{monitor_id}")
     assert resp.status_code == 200, f"Delete failed: {resp.status_code} {resp.text}"
+    mark_deleted(monitor_id)
     print("  PASS: Monitor deleted")
 
-
-if __name__ == "__main__":
-    test_create_monitor()
-    test_list_monitors()
-    test_get_monitor()
-    test_toggle_monitor()
-    test_monitor_pings()
-    test_ssl_list()
-    test_ssl_check()
-    test_delete_monitor()
-    print("\nALL MONITOR TESTS PASSED")
@@ -1,7 +1,9 @@
 """
 Test: Ops integration proxy endpoints (SRE, tickets, reviews).
 """
-from conftest import api_get
+import asyncio
+
+from conftest import api_get, api_get_async
 
 
 def test_ops_overview():
@@ -33,9 +35,10 @@ def test_reviews():
     print("  PASS: Reviews retrieved")
 
 
-if __name__ == "__main__":
-    test_ops_overview()
-    test_sre_events()
-    test_support_tickets()
-    test_reviews()
-    print("\nALL OPS TESTS PASSED")
+async def test_ops_fanout(client):
+    """GET all ops proxy endpoints at once — they are independent of each other."""
+    paths = ["/ops/overview", "/ops/sre/events", "/ops/tickets", "/ops/reviews"]
+    responses = await asyncio.gather(*(api_get_async(client, path) for path in paths))
+    for path, resp in zip(paths, responses):
+        assert resp.status_code == 200, f"{path} failed: {resp.status_code} {resp.text}"
+    print(f"  PASS: {len(paths)} ops endpoints fetched concurrently")
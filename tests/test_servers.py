@@ -1,28 +1,49 @@
 """
 Test: Server CRUD + SSH connection endpoints.
 """
-from conftest import api_get, api_post, api_put, api_delete, SSH_HOST, SSH_USER, SSH_PASS
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from _shared_server import shared_ssh_test
+from conftest import api_get, api_post, api_put, api_delete, extract_id, SERVER_PAYLOAD, WORKER_ID
 
 CREATED_SERVER_ID = None
 
+# The rename only needs the id, so it is sent as soon as the server exists and
+# overlaps the list/get calls; test_update_server collects its response.
+_UPDATE_FUTURE = None
+
+
+@pytest.fixture(scope="module")
+def rename_executor():
+    """Thread for the early rename PUT, joined once the module's tests are done."""
+    executor = ThreadPoolExecutor(max_workers=1)
+    yield executor
+    executor.shutdown(wait=True)
+
+
+def _rename_server(server_id):
+    return api_put(f"/servers/{server_id}", json={
+        "name": f"Test Server (Updated {WORKER_ID})",
+    })
 
-def test_create_server():
+
+def test_create_server(request, rename_executor):
     """POST /api/servers — create server with SSH credentials."""
-    global CREATED_SERVER_ID
+    global CREATED_SERVER_ID, _UPDATE_FUTURE
     resp = api_post("/servers", json={
-        "name": "Test Server (CI)",
-        "host": SSH_HOST,
-        "port": 22,
-        "username": SSH_USER,
-        "password": SSH_PASS,
-        "auth_type": "password",
+        "name": f"Test Server (CI {WORKER_ID})",
+        **SERVER_PAYLOAD,
         "is_default": False,
     })
     assert resp.status_code in [200, 201], f"Create server failed: {resp.status_code} {resp.text}"
-    data = resp.json()
-    server = data.get("server", data)
-    assert "id" in server or "ID" in server, f"Missing server ID: {data}"
-    CREATED_SERVER_ID = server.get("id") or server.get("ID")
+    CREATED_SERVER_ID = extract_id(resp, "server")
+    assert CREATED_SERVER_ID, f"Missing server ID: {resp.text}"
+    # Only when test_update_server will collect it; otherwise it could race test_delete_server
+    if any(item.module is request.module and item.name == "test_update_server"
+           for item in request.session.items):
+        _UPDATE_FUTURE = rename_executor.submit(_rename_server, CREATED_SERVER_ID)
     print(f"  PASS: Server created — id={CREATED_SERVER_ID}")
 
 
@@ -39,8 +60,7 @@ def test_list_servers():
 def test_get_server():
     """GET /api/servers/:id — get single server."""
     if not CREATED_SERVER_ID:
-        print("  SKIP: No server created")
-        return
+        pytest.skip("No server created")
     resp = api_get(f"/servers/{CREATED_SERVER_ID}")
     assert resp.status_code == 200, f"Get server failed: {resp.status_code} {resp.text}"
     data = resp.json()
@@ -50,23 +70,17 @@ def test_get_server():
 def test_update_server():
     """PUT /api/servers/:id — update server name."""
     if not CREATED_SERVER_ID:
-        print("  SKIP: No server created")
-        return
-    resp = api_put(f"/servers/{CREATED_SERVER_ID}", json={
-        "name": "Test Server (Updated)",
-    })
+        pytest.skip("No server created")
+    resp = _UPDATE_FUTURE.result()
     assert resp.status_code == 200, f"Update server failed: {resp.status_code} {resp.text}"
     print("  PASS: Server updated")
 
 
-def test_test_ssh_connection():
-    """POST /api/servers/:id/test — test SSH connectivity."""
-    if not CREATED_SERVER_ID:
-        print("  SKIP: No server created")
-        return
-    resp = api_post(f"/servers/{CREATED_SERVER_ID}/test")
-    assert resp.status_code == 200, f"SSH test failed: {resp.status_code} {resp.text}"
-    data = resp.json()
+def test_test_ssh_connection(server_id):
+    """POST /api/servers/:id/test — test SSH connectivity (run at most once per test run)."""
+    result = shared_ssh_test(server_id)
+    data = result["body"]
+    assert result["status"] == 200, f"SSH test failed: {result['status']} {data}"
     assert "fingerprint" in data or "message" in data, f"Unexpected response: {data}"
     print(f"  PASS: SSH connection test OK")
 
@@ -74,8 +88,7 @@ def test_test_ssh_connection():
 def test_server_metrics():
     """GET /api/servers/:id/metrics — get historical metrics."""
     if not CREATED_SERVER_ID:
-        print("  SKIP: No server created")
-        return
+        pytest.skip("No server created")
     resp = api_get(f"/servers/{CREATED_SERVER_ID}/metrics", params={"period": "1h"})
     assert resp.status_code == 200, f"Metrics failed: {resp.status_code} {resp.text}"
     print("  PASS: Server metrics retrieved")
@@ -84,8 +97,7 @@ def test_server_metrics():
 def test_server_live_metrics():
     """GET /api/servers/:id/metrics/live — get live metrics."""
     if not CREATED_SERVER_ID:
-        print("  SKIP: No server created")
-        return
+        pytest.skip("No server created")
     resp = api_get(f"/servers/{CREATED_SERVER_ID}/metrics/live")
     # May return 200 or 502 if metrics collection hasn't run yet
     assert resp.status_code in [200, 404, 502], f"Live metrics failed: {resp.status_code} {resp.text}"
@@ -95,20 +107,8 @@ def test_server_live_metrics():
 def test_delete_server():
     """DELETE /api/servers/:id — delete server."""
     if not CREATED_SERVER_ID:
-        print("  SKIP: No server created")
-        return
+        pytest.skip("No server created")
     resp = api_delete(f"/servers/{CREATED_SERVER_ID}")
     assert resp.status_code == 200, f"Delete server failed: {resp.status_code} {resp.text}"
     print("  PASS: Server deleted")
 
-
-if __name__ == "__main__":
-    test_create_server()
-    test_list_servers()
-    test_get_server()
-    test_update_server()
-    test_test_ssh_connection()
-    test_server_metrics()
-    test_server_live_metrics()
-    test_delete_server()
-    print("\nALL SERVER TESTS PASSED")